@@ -31,23 +31,42 @@ aggregated for campus-level analysis. No personally identifiable information
 (PII) is stored or analyzed.
 """
 
+import argparse
 import sqlite3
 import re
 import json
-import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter, Retry
+
+# C-accelerated JSON writer for the records export; the cleanup script
+# uses the same codec so both ends of the pipeline match. Optional dep.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml parses roughly an order of magnitude faster than the stdlib parser;
+# fall back gracefully when it is not installed.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 # ── Configuration ──────────────────────────────────────────────────────────
 
 BASE_URL = "https://www.police.psu.edu/daily-crime-log"
 DB_PATH = "psu_crime_log.db"
+JSON_PATH = "psu_crime_log_records.json"
 DEBUG_HTML_DIR = Path("debug_html")
 
 # Default time window when the user does not specify --days explicitly.
@@ -85,6 +104,25 @@ CAMPUSES = {
     "York":          "York",
 }
 
+# Shared connection pool: sized so keep-alive connections survive across
+# pages and parallel workers instead of being evicted and re-handshaken,
+# with retries for transient server/rate-limit responses.
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+)
+
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
 # Campus code mapping for incident numbers
 CAMPUS_CODES = {
     "UP": "University Park",
@@ -124,6 +162,33 @@ CAMPUS_CODES = {
 # Reverse mapping
 CAMPUS_NAME_TO_CODE = {v: k for k, v in CAMPUS_CODES.items()}
 
+# Labeled field containers extracted from each .views-row block, fixed
+# once at module scope as (record key, container class) pairs so the hot
+# parse loop never rebuilds lookup structure per block.
+_FIELD_CLASSES = (
+    ("reported_datetime",  "field--name-field-reported"),
+    ("occurred_datetime",  "field--name-field-occurred"),
+    ("nature_of_incident", "field--name-field-nature-of-incident1"),
+    ("offenses",           "field--name-field-offenses1"),
+    ("location",           "field--name-field-location"),
+)
+
+# Campus code prefix in incident numbers, e.g. "24UP12345" -> "UP".
+_CODE_RE = re.compile(r'\d{2}([A-Z]{2,3})')
+
+# Each incident is rendered as a `.views-row` block in the PSU site; the
+# strainer makes BeautifulSoup skip everything else (header, footer, nav)
+# while building the tree. The class rule must be token-aware: during
+# straining the raw attribute string ("views-row views-row-1 ...") is
+# matched as a whole, so a plain class_="views-row" would drop any block
+# carrying extra class tokens.
+def _is_views_row(class_attr):
+    return class_attr is not None and (
+        class_attr == "views-row" or "views-row" in class_attr.split()
+    )
+
+_STRAINER = SoupStrainer("div", class_=_is_views_row)
+
 # ── Logging Setup ──────────────────────────────────────────────────────────
 
 def setup_logging(debug=False):
@@ -140,14 +205,31 @@ logger = logging.getLogger(__name__)
 
 # ── Parsing ────────────────────────────────────────────────────────────────
 
+# Tracks whether DEBUG_HTML_DIR has been created this run, so debug mode
+# doesn't re-stat the directory for every page of every campus.
+_DEBUG_DIR_READY = False
+
 def save_debug_html(html: str, campus: str, page: int):
     """Save raw HTML to disk for debugging when the site structure changes."""
-    DEBUG_HTML_DIR.mkdir(exist_ok=True)
+    global _DEBUG_DIR_READY
+    if not _DEBUG_DIR_READY:
+        DEBUG_HTML_DIR.mkdir(exist_ok=True)
+        _DEBUG_DIR_READY = True
     filepath = DEBUG_HTML_DIR / f"{campus.replace(' ', '_')}_page{page}.html"
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(html)
     logger.debug(f"Saved debug HTML to {filepath}")
 
+def _field_item(block, field_class: str):
+    """Find the .field__item value element under a labeled field container.
+
+    Equivalent to ``block.select_one("div.<field_class> .field__item")`` but
+    via ``.find``, which skips the CSS-selector compilation and full-subtree
+    walk on every call.
+    """
+    container = block.find("div", class_=field_class)
+    return container.find(class_="field__item") if container else None
+
 def parse_incidents(html: str, campus_label: str, debug: bool = False) -> List[Dict]:
     """
     Parse incident records from the crime log HTML page.
@@ -155,18 +237,17 @@ def parse_incidents(html: str, campus_label: str, debug: bool = False) -> List[D
     The page structure uses .views-row for each incident, with structured HTML fields.
     Fields are in divs with class "field__item" under labeled containers.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_STRAINER)
     incidents = []
 
-    # Each incident is rendered as a `.views-row` block in the PSU site.
-    # If this selector stops matching, the upstream HTML likely changed.
-    blocks = soup.select(".views-row")
+    # If this lookup stops matching, the upstream HTML likely changed.
+    blocks = soup.find_all("div", class_="views-row", recursive=False)
 
     if not blocks:
         logger.warning(f"No incident blocks found for {campus_label}")
         if debug:
             logger.debug("HTML preview:")
-            logger.debug(soup.prettify()[:2000])
+            logger.debug(html[:2000])
         return incidents
 
     for idx, block in enumerate(blocks):
@@ -183,38 +264,20 @@ def parse_incidents(html: str, campus_label: str, debug: bool = False) -> List[D
 
         try:
             # Extract Incident Number from h2 or title field
-            incident_elem = block.select_one("span.field--name-title")
+            incident_elem = block.find("span", class_="field--name-title")
             if incident_elem:
                 incident["incident_number"] = incident_elem.get_text(strip=True)
                 # Extract campus code from incident number (e.g., "24UP12345" -> "UP")
-                code_match = re.match(r'\d{2}([A-Z]{2,3})', incident["incident_number"])
+                code_match = _CODE_RE.match(incident["incident_number"])
                 if code_match:
                     incident["campus_code"] = code_match.group(1)
 
-            # Extract Reported datetime
-            reported_elem = block.select_one("div.field--name-field-reported .field__item")
-            if reported_elem:
-                incident["reported_datetime"] = reported_elem.get_text(strip=True)
-
-            # Extract Occurred datetime (may be a range)
-            occurred_elem = block.select_one("div.field--name-field-occurred .field__item")
-            if occurred_elem:
-                incident["occurred_datetime"] = occurred_elem.get_text(strip=True)
-
-            # Extract Nature of Incident
-            nature_elem = block.select_one("div.field--name-field-nature-of-incident1 .field__item")
-            if nature_elem:
-                incident["nature_of_incident"] = nature_elem.get_text(strip=True)
-
-            # Extract Offenses
-            offenses_elem = block.select_one("div.field--name-field-offenses1 .field__item")
-            if offenses_elem:
-                incident["offenses"] = offenses_elem.get_text(strip=True)
-
-            # Extract Location
-            location_elem = block.select_one("div.field--name-field-location .field__item")
-            if location_elem:
-                incident["location"] = location_elem.get_text(strip=True)
+            # Extract the labeled fields (reported/occurred datetimes,
+            # nature, offenses, location) via the precomputed table
+            for key, field_class in _FIELD_CLASSES:
+                elem = _field_item(block, field_class)
+                if elem:
+                    incident[key] = elem.get_text(strip=True)
 
             if debug and idx == 0:
                 logger.debug(f"First incident parsed:")
@@ -240,6 +303,13 @@ def parse_incidents(html: str, campus_label: str, debug: bool = False) -> List[D
 
 # ── Scraping ───────────────────────────────────────────────────────────────
 
+def make_session() -> requests.Session:
+    """Build a Session with the standard headers and pooled adapter mounted."""
+    s = requests.Session()
+    s.headers.update(REQUEST_HEADERS)
+    s.mount("https://", _ADAPTER)
+    return s
+
 def scrape_campus(campus_filter: str, campus_label: str,
                   start_date: Optional[str] = None, end_date: Optional[str] = None,
                   session: Optional[requests.Session] = None,
@@ -266,36 +336,46 @@ def scrape_campus(campus_filter: str, campus_label: str,
         When ``True``, emit additional logging and save HTML snapshots.
     """
 
-    s = session or requests.Session()
-    s.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    })
+    s = session or make_session()
 
     all_incidents = []
     page = 0
     consecutive_empty = 0
     max_consecutive_empty = 3
 
+    # Only the page number varies between requests; build the rest of the
+    # query once instead of reassembling the dict on every iteration.
+    params = {"campus": campus_filter, "page": page}
+    if start_date:
+        params["field_reported_date_value[min]"] = start_date
+    if end_date:
+        params["field_reported_date_value[max]"] = end_date
+
     while page < max_pages:
-        params = {"campus": campus_filter, "page": page}
-        if start_date:
-            params["field_reported_date_value[min]"] = start_date
-        if end_date:
-            params["field_reported_date_value[max]"] = end_date
+        params["page"] = page
 
         try:
             logger.info(f"  Fetching page {page}...")
-            resp = s.get(BASE_URL, params=params, timeout=30)
+            resp = s.get(BASE_URL, params=params, timeout=30, stream=True)
             resp.raise_for_status()
 
+            # Reject obviously-dead pages from the header alone, before
+            # paying for the body download and UTF-8 decode.
+            content_length = int(resp.headers.get("Content-Length") or 0)
+            if 0 < content_length < 500:
+                logger.warning(f"  Suspiciously short response ({content_length} bytes)")
+                resp.close()
+                break
+
+            # Decode exactly once; every `resp.text` access re-decodes.
+            html = resp.text
+
             if debug:
-                save_debug_html(resp.text, campus_label, page)
+                save_debug_html(html, campus_label, page)
 
-            # Check if we got a valid response
-            if len(resp.text) < 500:
-                logger.warning(f"  Suspiciously short response ({len(resp.text)} bytes)")
+            # Check if we got a valid response (no Content-Length header)
+            if len(html) < 500:
+                logger.warning(f"  Suspiciously short response ({len(html)} bytes)")
                 break
 
         except requests.exceptions.Timeout:
@@ -305,7 +385,7 @@ def scrape_campus(campus_filter: str, campus_label: str,
             logger.error(f"  Error fetching {campus_label} page {page}: {e}")
             break
 
-        incidents = parse_incidents(resp.text, campus_label, debug=debug)
+        incidents = parse_incidents(html, campus_label, debug=debug)
 
         if not incidents:
             consecutive_empty += 1
@@ -341,7 +421,6 @@ def scrape_all_campuses(days_back: int = DEFAULT_DAYS, specific_campus: Optional
 
     logger.info(f"Date range: {start_str} to {end_str}")
 
-    session     = requests.Session()
     all_records = []
 
     # Filter to specific campus if requested
@@ -358,14 +437,26 @@ def scrape_all_campuses(days_back: int = DEFAULT_DAYS, specific_campus: Optional
             logger.error(f"Campus '{specific_campus}' not found!")
             return []
 
-    for filter_code, label in campuses_to_scrape:
-        logger.info(f"\n🏫 Scraping: {label} ({filter_code})")
-        records = scrape_campus(filter_code, label, start_str, end_str, session, debug=debug)
-        logger.info(f"  ✅ {len(records)} total incidents")
-        all_records.extend(records)
-
-        # Small delay between campuses
-        time.sleep(2.0)
+    # Each campus is an independent URL sequence, so the wall time is pure
+    # HTTP latency: overlap it with a bounded thread pool. Every worker gets
+    # its own Session (scrape_campus creates one when session is None)
+    # because a shared Session is not safe across concurrent .get() calls.
+    # The per-page 1s sleep inside scrape_campus still rate-limits the host.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(scrape_campus, filter_code, label,
+                            start_str, end_str, None, 100, debug): label
+            for filter_code, label in campuses_to_scrape
+        }
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                records = future.result()
+            except Exception as e:
+                logger.error(f"  ❌ {label} failed: {e}")
+                continue
+            logger.info(f"  ✅ {label}: {len(records)} total incidents")
+            all_records.extend(records)
 
     return all_records
 
@@ -409,6 +500,13 @@ CREATE TABLE IF NOT EXISTS incident_offenses (
 );
 """
 
+# Secondary indexes so the summary views aggregate and sort via index
+# scans instead of full-table scans.
+CREATE_INDEXES_SQL = [
+    "CREATE INDEX IF NOT EXISTS idx_incidents_campus ON incidents(campus_id);",
+    "CREATE INDEX IF NOT EXISTS idx_incidents_reported ON incidents(reported_datetime DESC);",
+]
+
 CREATE_VIEWS_SQL = [
     """
     CREATE VIEW IF NOT EXISTS v_incidents_full AS
@@ -458,9 +556,39 @@ CAMPUS_SEED = [
     (code, name) for code, name in CAMPUS_CODES.items()
 ]
 
+def _tune(con: sqlite3.Connection):
+    """
+    Apply write-friendly pragmas to a fresh connection.
+
+    WAL journaling plus synchronous=NORMAL drops the two-fsyncs-per-commit
+    behaviour of the default DELETE journal, which is the dominant cost of
+    an insert-heavy build on an otherwise idle database.
+    """
+    con.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA mmap_size=268435456;"
+    )
+
+def _split_offenses(offense_text: str) -> List[str]:
+    """Split the raw offenses field into clean, plausible offense codes."""
+    codes = []
+    for raw_offense in offense_text.split("\n"):
+        code_str = raw_offense.strip()
+        if code_str and len(code_str) <= 200:
+            codes.append(code_str)
+    return codes
+
 def build_database(records: List[Dict], db_path: str = DB_PATH) -> sqlite3.Connection:
     """Create the SQLite database and insert all records."""
     con = sqlite3.connect(db_path)
+    _tune(con)
+    # Standard SQLite bulk-import pattern: leave foreign keys unenforced
+    # during the batch (skips a parent-table B-tree probe per row), then
+    # verify the result wholesale before re-enabling.
+    con.execute("PRAGMA foreign_keys=OFF")
     cur = con.cursor()
 
     # Create tables
@@ -468,6 +596,8 @@ def build_database(records: List[Dict], db_path: str = DB_PATH) -> sqlite3.Conne
     cur.execute(CREATE_INCIDENTS_SQL)
     cur.execute(CREATE_OFFENSES_SQL)
     cur.execute(CREATE_INCIDENT_OFFENSES_SQL)
+    for index_sql in CREATE_INDEXES_SQL:
+        cur.execute(index_sql)
     for view_sql in CREATE_VIEWS_SQL:
         cur.execute(view_sql)
 
@@ -481,103 +611,137 @@ def build_database(records: List[Dict], db_path: str = DB_PATH) -> sqlite3.Conne
     cur.execute("SELECT campus_code, campus_id FROM campuses")
     campus_map = dict(cur.fetchall())
 
+    # Most records repeat the same handful of campuses, so cache the
+    # code-then-name fallback chain: one cached lookup per record instead
+    # of up to three dict probes. 64 entries covers every known campus.
+    @lru_cache(maxsize=64)
+    def resolve_campus(code: str, campus_name: str) -> Optional[int]:
+        campus_id = campus_map.get(code)
+        if campus_id:
+            return campus_id
+        logger.warning(f"  Unknown campus code: {code} for campus {campus_name}")
+        alt_code = CAMPUS_NAME_TO_CODE.get(campus_name)
+        return campus_map.get(alt_code) if alt_code else None
+
+    # One round trip to learn every incident number we already have, so the
+    # main loop can deduplicate with a set lookup instead of a per-record
+    # SELECT against the incidents table.
+    cur.execute("SELECT incident_number FROM incidents WHERE incident_number IS NOT NULL")
+    known_numbers = {row[0] for row in cur.fetchall()}
+
     inserted = 0
-    updated = 0
     skipped = 0
 
+    # Accumulate rows here and flush them with executemany inside a single
+    # transaction below: thousands of per-row INSERTs under autocommit each
+    # pay their own fsync, which dominates the build time.
+    incident_rows = []        # rows keyed by incident_number
+    numbered_codes = []       # (incident_number, offense_code) pairs
+    loose_records = []        # records without an incident number
+    all_codes = set()         # every offense code seen this run
+
     for rec in records:
-        code = rec.get("campus_code", "")
-        campus_id = campus_map.get(code)
+        campus_id = resolve_campus(rec.get("campus_code", ""), rec.get("campus", ""))
 
         if not campus_id:
-            logger.warning(f"  Unknown campus code: {code} for campus {rec.get('campus')}")
-            # Try to get by name
-            campus_name = rec.get("campus", "")
-            code = CAMPUS_NAME_TO_CODE.get(campus_name)
-            campus_id = campus_map.get(code) if code else None
-
-            if not campus_id:
-                logger.warning(f"  Skipping record, cannot determine campus")
-                skipped += 1
-                continue
+            logger.warning(f"  Skipping record, cannot determine campus")
+            skipped += 1
+            continue
 
-        # Parse occurred datetime
-        occ       = rec.get("occurred_datetime", "")
-        occ_parts = [p.strip() for p in occ.split(" to ")] if occ else []
-        occ_start = occ_parts[0] if occ_parts else ""
-        occ_end   = occ_parts[1] if len(occ_parts) > 1 else ""
+        # Parse occurred datetime; most rows are a single timestamp, so only
+        # split when the range separator is actually present.
+        occ = rec.get("occurred_datetime", "")
+        if " to " in occ:
+            occ_start, _, occ_end = (p.strip() for p in occ.partition(" to "))
+        else:
+            occ_start, occ_end = occ.strip(), ""
 
         incident_number = rec.get("incident_number", "")
 
-        try:
-            # Check if incident already exists
-            if incident_number:
-                cur.execute(
-                    "SELECT id FROM incidents WHERE incident_number = ?",
-                    (incident_number,)
-                )
-                existing = cur.fetchone()
-
-                if existing:
-                    logger.debug(f"  Incident {incident_number} already exists, skipping")
-                    skipped += 1
-                    continue
-
-            # Insert incident
-            cur.execute(
-                """INSERT INTO incidents
-                   (incident_number, campus_id, reported_datetime,
-                    occurred_start, occurred_end,
-                    nature_of_incident, location)
-                   VALUES (?,?,?,?,?,?,?)""",
-                (
-                    incident_number or None,
-                    campus_id,
-                    rec.get("reported_datetime", ""),
-                    occ_start,
-                    occ_end,
-                    rec.get("nature_of_incident", ""),
-                    rec.get("location", ""),
-                )
-            )
-            inc_id = cur.lastrowid
-
-            # Insert offenses
-            offense_text = rec.get("offenses", "")
-            if offense_text:
-                # Split by newlines and clean
-                for raw_offense in offense_text.split("\n"):
-                    code_str = raw_offense.strip()
-                    if not code_str or len(code_str) > 200:
-                        continue
-
-                    cur.execute(
-                        "INSERT OR IGNORE INTO offense_types (offense_code) VALUES (?)",
-                        (code_str,)
-                    )
-                    cur.execute(
-                        "SELECT offense_id FROM offense_types WHERE offense_code=?",
-                        (code_str,)
-                    )
-                    off_row = cur.fetchone()
-                    if off_row:
-                        off_id = off_row[0]
-                        cur.execute(
-                            "INSERT OR IGNORE INTO incident_offenses VALUES (?,?)",
-                            (inc_id, off_id)
-                        )
-
-            inserted += 1
-
-        except sqlite3.IntegrityError as e:
-            logger.debug(f"  Duplicate incident: {incident_number}")
-            skipped += 1
-        except Exception as e:
-            logger.error(f"  ⚠️  DB insert error for {incident_number}: {e}")
-            logger.debug(f"  Problematic record: {json.dumps(rec, indent=2)}")
+        if incident_number and incident_number in known_numbers:
+            logger.debug(f"  Incident {incident_number} already exists, skipping")
             skipped += 1
+            continue
+
+        row = (
+            incident_number or None,
+            campus_id,
+            rec.get("reported_datetime", ""),
+            occ_start,
+            occ_end,
+            rec.get("nature_of_incident", ""),
+            rec.get("location", ""),
+        )
+
+        offense_codes = _split_offenses(rec.get("offenses", ""))
+        all_codes.update(offense_codes)
+
+        if incident_number:
+            known_numbers.add(incident_number)
+            incident_rows.append(row)
+            numbered_codes.extend((incident_number, c) for c in offense_codes)
+        else:
+            # No stable key to map offenses back to after a bulk insert, so
+            # these few rows go through cur.execute/lastrowid individually.
+            loose_records.append((row, offense_codes))
+
+        inserted += 1
+
+    insert_sql = """INSERT OR IGNORE INTO incidents
+                    (incident_number, campus_id, reported_datetime,
+                     occurred_start, occurred_end,
+                     nature_of_incident, location)
+                    VALUES (?,?,?,?,?,?,?)"""
+
+    try:
+        # `with con:` wraps everything in one transaction: a single commit
+        # (and fsync) for the whole batch instead of one per statement.
+        with con:
+            cur.executemany(insert_sql, incident_rows)
+
+            # Register every offense code in one batch, then resolve ids
+            # through a local dict: repeated codes ("Theft", "Harassment")
+            # dominate the data, so this replaces per-offense round trips
+            # with in-memory lookups.
+            cur.executemany(
+                "INSERT OR IGNORE INTO offense_types (offense_code) VALUES (?)",
+                [(c,) for c in all_codes]
+            )
+            cur.execute("SELECT offense_code, offense_id FROM offense_types")
+            off_map = dict(cur.fetchall())
+
+            offense_pairs = []  # (incident_id, offense_id)
+
+            for row, offense_codes in loose_records:
+                cur.execute(insert_sql, row)
+                inc_id = cur.lastrowid
+                for code_str in offense_codes:
+                    offense_pairs.append((inc_id, off_map[code_str]))
+
+            if numbered_codes:
+                cur.execute("SELECT incident_number, id FROM incidents WHERE incident_number IS NOT NULL")
+                inc_map = dict(cur.fetchall())
+                for incident_number, code_str in numbered_codes:
+                    inc_id = inc_map.get(incident_number)
+                    if inc_id is not None:
+                        offense_pairs.append((inc_id, off_map[code_str]))
+
+            cur.executemany(
+                "INSERT OR IGNORE INTO incident_offenses VALUES (?,?)",
+                offense_pairs
+            )
+
+            violations = cur.execute("PRAGMA foreign_key_check").fetchall()
+            if violations:
+                logger.warning(f"  ⚠️  {len(violations)} foreign key violations after bulk insert")
+                for table, rowid, parent, _ in violations[:10]:
+                    logger.warning(f"    {table} rowid {rowid} -> missing {parent} row")
+    except Exception as e:
+        logger.error(f"  ⚠️  DB bulk insert error: {e}")
+        raise
+
+    con.execute("PRAGMA foreign_keys=ON")
 
-    con.commit()
     logger.info(f"\n✅ Inserted: {inserted} | Skipped: {skipped}")
     return con
 
@@ -586,6 +750,9 @@ def build_database(records: List[Dict], db_path: str = DB_PATH) -> sqlite3.Conne
 def print_summary(con: sqlite3.Connection):
     """Print database statistics."""
     cur = con.cursor()
+    # Read-only path: named column access costs nothing here and keeps the
+    # report code readable.
+    cur.row_factory = sqlite3.Row
 
     print("\n" + "="*70)
     print(" DATABASE SUMMARY")
@@ -653,3 +820,50 @@ def print_summary(con: sqlite3.Connection):
 
     print("\n" + "="*70)
 
+# ── Entry Point ────────────────────────────────────────────────────────────
+
+def main():
+    """Scrape the crime log, save raw records, and build the database."""
+    parser = argparse.ArgumentParser(
+        description="Scrape the Penn State Daily Crime Log into SQLite + JSON."
+    )
+    parser.add_argument(
+        "--days", "-d", type=int, default=DEFAULT_DAYS,
+        help=f"number of days of history to scrape (default: {DEFAULT_DAYS}, max: {MAX_DAYS})"
+    )
+    parser.add_argument(
+        "--campus", "-c",
+        help="scrape only campuses whose name contains this text"
+    )
+    parser.add_argument(
+        "--debug", action="store_true",
+        help="verbose logging plus HTML snapshots in debug_html/"
+    )
+    args = parser.parse_args()
+
+    setup_logging(debug=args.debug)
+
+    days = min(max(args.days, 1), MAX_DAYS)
+    if days != args.days:
+        logger.warning(f"--days {args.days} out of range, using {days}")
+
+    records = scrape_all_campuses(days_back=days, specific_campus=args.campus,
+                                  debug=args.debug)
+    logger.info(f"\nScraped {len(records)} records total")
+
+    if orjson is not None:
+        # Single write_bytes call; orjson serializes several times faster
+        # than the stdlib encoder on multi-thousand-record scrapes.
+        Path(JSON_PATH).write_bytes(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+    else:
+        with open(JSON_PATH, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+    logger.info(f"Raw records saved to {JSON_PATH}")
+
+    con = build_database(records)
+    print_summary(con)
+    con.close()
+
+if __name__ == "__main__":
+    main()
+